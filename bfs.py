@@ -17,54 +17,134 @@ class BFS:
     ):
         """Retorna o menor caminho para a posição alvo.
         As coordenadas usadas devem ser passadas e serão
-        retornadas invertidas, ou seja, (y, x)."""
+        retornadas invertidas, ou seja, (y, x).
 
-        pending_positions = deque([start_position])
-        visited_posotions = {start_position}
-        previous_position = {start_position: tuple()}
+        Com um `Board`, reutiliza o contexto guardado nele, cujas paredes
+        são lidas na primeira busca. Com uma lista simples, as paredes são
+        lidas a cada chamada."""
 
-        board_height = len(board)
-        board_width = len(board[0])
+        get_context = getattr(board, 'get_bfs_context', None)
+        context = get_context() if get_context is not None else BFSContext(board)
 
-        while pending_positions:
-            # Obtém a proxima posição na fila e verifica
-            # se é a posição alvo.
-            current_position = pending_positions.popleft()
-            if current_position == target_position:
+        return context.search(start_position, target_position)
+
+
+class BFSContext:
+    """Contexto reutilizável de busca em largura ligado a um tabuleiro.
+
+    Trabalha com indices lineares das celulas (`y * largura + x`) e mantém
+    buffers pré-alocados, de modo que buscas repetidas não criam objetos
+    por celula visitada. As paredes são lidas apenas na criação do contexto,
+    já que elas não mudam durante o jogo."""
+
+    def __init__(self, board: list[list[int]]):
+        self.height = len(board)
+        self.width = len(board[0])
+        size = self.height * self.width
+
+        # Vizinhos livres de cada celula, na mesma ordem de `DIRECTIONS`.
+        self._neighbors = [()] * size
+        for y in range(self.height):
+            for x in range(self.width):
+                if board[y][x] == WALL:
+                    continue
+
+                neighbors = []
+                for delta_y, delta_x in DIRECTIONS:
+                    neighbor_y = y + delta_y
+                    neighbor_x = x + delta_x
+                    if (
+                        0 <= neighbor_y < self.height
+                        and 0 <= neighbor_x < self.width
+                        and board[neighbor_y][neighbor_x] != WALL
+                    ):
+                        neighbors.append(neighbor_y * self.width + neighbor_x)
+
+                self._neighbors[y * self.width + x] = tuple(neighbors)
+
+        # Uma celula é considerada visitada quando o seu carimbo é igual
+        # à geração atual, assim não é preciso limpar o buffer entre buscas.
+        self._visited = [0] * size
+        self._generation = 0
+        self._parents = [-1] * size
+        # Cada celula entra na fila no máximo uma vez por busca, então
+        # uma fila com a capacidade do tabuleiro nunca precisa dar a volta.
+        self._queue = [0] * size
+        self._path = [0] * size
+
+    def to_index(self, position: tuple[int, int]):
+        """Converte uma posição (y, x) para o indice linear da celula."""
+
+        return position[0] * self.width + position[1]
+
+    def to_position(self, index: int):
+        """Converte o indice linear de uma celula para a posição (y, x)."""
+
+        return divmod(index, self.width)
+
+    def search_indices(self, start_index: int, target_index: int):
+        """Busca o menor caminho entre dois indices lineares.
+
+        Preenche o buffer `path` do alvo (inclusivo) até a posição inicial
+        (exclusiva) e retorna o tamanho do caminho, ou -1 caso o alvo
+        não seja alcançável."""
+
+        self._generation += 1
+        generation = self._generation
+        visited = self._visited
+        parents = self._parents
+        queue = self._queue
+        neighbors = self._neighbors
+
+        visited[start_index] = generation
+        parents[start_index] = -1
+        queue[0] = start_index
+        head, tail = 0, 1
+
+        while head < tail:
+            # Obtém a proxima celula na fila e verifica
+            # se é a celula alvo.
+            current = queue[head]
+            head += 1
+            if current == target_index:
                 break
 
-            # Percorre todos os vizinhos possiveis da posição atual,
-            # acima, abaixo e para a esquerda e para a direita.
-            for delta_y, delta_x in DIRECTIONS:
-                neighbor_position = (
-                    current_position[0] + delta_y,
-                    current_position[1] + delta_x,
-                )
-
-                if (
-                    # Verifica se as coordenadas do vizinho estão dentro do tabuleiro.
-                    0 <= neighbor_position[0] < board_height
-                    and 0 <= neighbor_position[1] < board_width
-                    # Verifica se o vizinho é um caminho livre.
-                    and board[neighbor_position[0]][neighbor_position[1]] != WALL
-                    # Verifica se o vizinho ainda não foi visitado.
-                    and neighbor_position not in visited_posotions
-                ):
-                    visited_posotions.add(neighbor_position)
-                    pending_positions.append(neighbor_position)
-                    previous_position[neighbor_position] = current_position
-
-        # Cria um caminho da posição inicial para a posição do alvo.
-        path = deque([target_position])
-        current_position = target_position
-
-        while current_position:
-            current_position = previous_position[current_position]
-            path.append(current_position)
-
-        # Remove o `None` adicionado no final do caminho
-        # e remove o caminho da posição inicial.
-        path.pop()
-        path.pop()
+            for neighbor in neighbors[current]:
+                if visited[neighbor] != generation:
+                    visited[neighbor] = generation
+                    parents[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+
+        if visited[target_index] != generation:
+            return -1
+
+        # Percorre os antecessores do alvo até a posição inicial.
+        path = self._path
+        length = 0
+        current = target_index
+        while current != start_index:
+            path[length] = current
+            length += 1
+            current = parents[current]
+
+        return length
+
+    @property
+    def path(self):
+        """Buffer com o último caminho encontrado por `search_indices`."""
+
+        return self._path
+
+    def search(self, start_position: tuple[int, int], target_position: tuple[int, int]):
+        """Retorna o menor caminho para a posição alvo no mesmo formato
+        de `BFS.search`, um deque de posições (y, x) em que a próxima
+        posição a ser seguida é a última."""
+
+        length = self.search_indices(self.to_index(start_position), self.to_index(target_position))
+
+        path = deque()
+        for i in range(length):
+            path.append(divmod(self._path[i], self.width))
 
         return path
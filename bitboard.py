@@ -0,0 +1,138 @@
+from config import ATMAN, FRUIT, GHOST, POINT, WALL
+
+
+class Bitboard:
+    """Representação do tabuleiro em bitsets (inteiros do Python).
+
+    Cada celula corresponde a um bit, no indice linear `y * largura + x`.
+    Mantém um bitset para paredes, pontos, frutas, Ghosts e o Atman, o que
+    permite consultas por máscara (contagem, colisão e flood fill) sem
+    percorrer o tabuleiro celula por celula."""
+
+    def __init__(self, board: list[list[int]]):
+        self.height = len(board)
+        self.width = len(board[0])
+        self.size = self.height * self.width
+        self.full = (1 << self.size) - 1
+
+        # Monta todos os bitsets de uma vez a partir das celulas em ordem
+        # inversa (o último indice vira o bit mais significativo).
+        cells = bytes(cell for row in reversed(board) for cell in reversed(row))
+        self.walls = self._mask_of(cells, WALL)
+        self.points = self._mask_of(cells, POINT)
+        self.fruits = self._mask_of(cells, FRUIT)
+        self.ghosts = self._mask_of(cells, GHOST)
+        self.atman = self._mask_of(cells, ATMAN)
+
+        # Máscaras das colunas das bordas, usadas para evitar que os
+        # deslocamentos horizontais passem de uma linha para a outra.
+        first_column = int(('0' * (self.width - 1) + '1') * self.height, 2)
+        self._not_first_column = self.full & ~first_column
+        self._not_last_column = self.full & ~(first_column << (self.width - 1))
+
+    @staticmethod
+    def _mask_of(cells: bytes, value: int):
+        """Retorna o bitset das celulas com o valor `value`."""
+
+        table = bytes(ord('1') if i == value else ord('0') for i in range(256))
+        return int(cells.translate(table), 2)
+
+    def bit(self, y: int, x: int):
+        """Retorna a máscara com apenas o bit da celula (y, x)."""
+
+        return 1 << (y * self.width + x)
+
+    def set_cell(self, y: int, x: int, value: int):
+        """Atualiza os bitsets para refletir o novo valor da celula (y, x)."""
+
+        bit = 1 << (y * self.width + x)
+        clear = ~bit
+
+        self.walls &= clear
+        self.points &= clear
+        self.fruits &= clear
+        self.ghosts &= clear
+        self.atman &= clear
+
+        if value == WALL:
+            self.walls |= bit
+        elif value == POINT:
+            self.points |= bit
+        elif value == FRUIT:
+            self.fruits |= bit
+        elif value == GHOST:
+            self.ghosts |= bit
+        elif value == ATMAN:
+            self.atman |= bit
+
+    def get_points_count(self):
+        """Retorna o número de pontos restantes no tabuleiro."""
+
+        return self.points.bit_count()
+
+    def collides(self, mask: int, y: int, x: int):
+        """Verifica se a celula (y, x) está presente na máscara `mask`."""
+
+        return bool(mask & (1 << (y * self.width + x)))
+
+    def distance_layers(self, start_position: tuple[int, int]):
+        """Gera, em ordem de distância até a posição inicial (y, x),
+        máscaras com as celulas alcançadas em cada distância.
+
+        Cada camada é obtida deslocando a fronteira inteira nas quatro
+        direções de uma só vez, em vez de expandir celula por celula."""
+
+        free = self.full & ~self.walls
+        width = self.width
+        not_first_column = self._not_first_column
+        not_last_column = self._not_last_column
+
+        frontier = self.bit(*start_position) & free
+        visited = frontier
+
+        while frontier:
+            yield frontier
+            expanded = (
+                ((frontier >> 1) & not_last_column)
+                | ((frontier << 1) & not_first_column)
+                | (frontier >> width)
+                | (frontier << width)
+            )
+            frontier = expanded & free & ~visited
+            visited |= frontier
+
+    def distance_map(self, start_position: tuple[int, int]):
+        """Retorna uma lista plana com a distância de cada celula até a
+        posição inicial (y, x). Celulas inalcançáveis valem -1.
+
+        Cada camada custa operações sobre inteiros do tamanho do tabuleiro,
+        então o custo total é proporcional a camadas x celulas. Só compensa
+        em tabuleiros abertos, com poucas camadas; em tabuleiros de
+        corredores o `BFSContext` é bem mais rápido. Quando basta saber a
+        distância até um alvo, `distance` é o caminho rápido."""
+
+        distances = [-1] * self.size
+
+        for distance, layer in enumerate(self.distance_layers(start_position)):
+            # Procura os bits ligados na representação binária invertida
+            # da camada (a partir do seu menor bit), o que é bem mais rápido
+            # do que isolar um bit de cada vez em inteiros grandes.
+            offset = (layer & -layer).bit_length() - 1
+            bits = format(layer >> offset, 'b')[::-1]
+            index = bits.find('1')
+            while index != -1:
+                distances[offset + index] = distance
+                index = bits.find('1', index + 1)
+
+        return distances
+
+    def distance(self, start_position: tuple[int, int], target_position: tuple[int, int]):
+        """Retorna a distância entre duas posições (y, x), ou -1 caso
+        o alvo não seja alcançável."""
+
+        target = self.bit(*target_position)
+        for distance, layer in enumerate(self.distance_layers(start_position)):
+            if layer & target:
+                return distance
+
+        return -1
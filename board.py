@@ -1,16 +1,25 @@
+from bfs import BFSContext
+from bitboard import Bitboard
 from config import EMPTY, FRUIT, POINT, WALL
 
 
 class Board(list):
     """Representa o tabuleiro do jogo."""
 
-    def __init__(self, board_num=1):
+    def __init__(self, board_num=1, use_bitboard=False):
         # Lê o tabuleiro de um arquivo
         # e calcula o número de pontos no tabuleiro.
         self._board = self.read_board_from_file(board_num)
-        self.points_count = self._get_points_count()
         super().__init__(self._board)
 
+        # Camada opcional de bitsets, mantida em sincronia
+        # pelos `move_to` do Atman e dos Ghosts.
+        self.bitboard = Bitboard(self._board) if use_bitboard else None
+        self.points_count = self.get_points_count()
+
+        # Contexto de busca compartilhado, criado no primeiro uso.
+        self._bfs_context = None
+
     @staticmethod
     def read_board_from_file(board_num):
         """Lê o tabuleiro de um arquivo com um formato especifico."""
@@ -54,6 +63,19 @@ class Board(list):
     def get_columns(self):
         return len(self[0])
 
+    def get_bfs_context(self):
+        """Retorna o contexto de busca do tabuleiro. As paredes são lidas
+        na criação do contexto, já que elas não mudam durante o jogo."""
+        if self._bfs_context is None:
+            self._bfs_context = BFSContext(self)
+        return self._bfs_context
+
+    def get_points_count(self):
+        """Retorna o número de pontos restantes no tabuleiro."""
+        if self.bitboard is not None:
+            return self.bitboard.get_points_count()
+        return self._get_points_count()
+
     def _get_points_count(self):
         points = 0
         for row in self._board:
@@ -0,0 +1,74 @@
+"""Verifica se a lógica do jogo pode ser importada sem o `curses`
+e dentro do orçamento de tempo de importação.
+
+Uso: python check_imports.py
+"""
+
+import os
+import subprocess
+import sys
+
+# Módulos que devem poder ser importados sem um terminal.
+HEADLESS_MODULES = (
+    'bfs',
+    'bitboard',
+    'board',
+    'config',
+    'entities',
+    'errors',
+    'pathfinding',
+    'replanning',
+    'timing_wheel',
+)
+IMPORT_TIME_BUDGET = 0.05  # (segundos)
+RUNS = 5
+
+MEASURE_CODE = f"""
+import sys
+from time import perf_counter
+
+start = perf_counter()
+import {', '.join(HEADLESS_MODULES)}
+print(perf_counter() - start)
+print(int('curses' in sys.modules or '_curses' in sys.modules))
+"""
+
+
+def measure():
+    """Importa os módulos em um novo interpretador e retorna
+    o tempo gasto e se o `curses` foi importado."""
+
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE_CODE],
+        # Executa a partir da pasta do projeto, para que os módulos
+        # sejam encontrados independente de onde o script foi chamado.
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    return float(output[0]), output[1] == '1'
+
+
+def main():
+    # Usa o menor tempo entre as execuções para reduzir o ruído.
+    results = [measure() for _ in range(RUNS)]
+    import_time = min(elapsed for elapsed, _ in results)
+    curses_imported = any(imported for _, imported in results)
+
+    print(f'Tempo de importação: {import_time * 1000:.1f}ms (orçamento: {IMPORT_TIME_BUDGET * 1000:.0f}ms)')
+
+    if curses_imported:
+        print('Erro: o curses foi importado pelos módulos da lógica do jogo.')
+        return 1
+
+    if import_time > IMPORT_TIME_BUDGET:
+        print('Erro: o tempo de importação excedeu o orçamento.')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
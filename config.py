@@ -1,4 +1,3 @@
-import curses
 from itertools import cycle
 
 # Tipos de celula.
@@ -29,22 +28,6 @@ CHARS = {
 }
 
 
-# Define as teclas mapeadas para direções.
-KEY_MAP = {
-    curses.KEY_UP: UP,
-    curses.KEY_DOWN: DOWN,
-    curses.KEY_LEFT: LEFT,
-    curses.KEY_RIGHT: RIGHT,
-    ord('w'): UP,
-    ord('W'): UP,
-    ord('s'): DOWN,
-    ord('S'): DOWN,
-    ord('a'): LEFT,
-    ord('A'): LEFT,
-    ord('d'): RIGHT,
-    ord('D'): RIGHT,
-}
-
 # Define o tempo de espera entre as renderizações.
 SLEEP_TIME = 0.19  # (segundos)
 
@@ -57,6 +40,22 @@ POINT_VALUE = 10
 # devem ou não se mover.
 MOVE = 1
 GHOST_MOVE_CICLE = cycle([0, MOVE])
+# Movimentos por tick dos Ghosts quando agendados
+# em um `TimingWheel` e quantos ticks um Ghost comido
+# leva para voltar à sua posição inicial.
+GHOST_SPEED = 0.5
+GHOST_RESPAWN_TICKS = 10
+# Ciclos da fruta por tick. Antes a fruta avançava a
+# cada movimento de Ghost (1.5 por tick com 3 Ghosts),
+# então ela continua durando `MAX_FRUIT_CYCLES / 1.5` ticks.
+FRUIT_SPEED = 1.5
 ATMAN_RANGE_SIZE = 7
 MAX_FRUIT_CYCLES = 75
 GHOST_VALUE = 300
+
+
+# Tempo máximo de CPU por tick para calcular novos caminhos
+# dos Ghosts e o número máximo de ticks que um pedido
+# de novo caminho pode ser adiado.
+AI_TICK_BUDGET = 0.002  # (segundos de CPU)
+MAX_REPLAN_STALENESS = 3
@@ -11,8 +11,10 @@ from config import (
     DOWN,
     EMPTY,
     FRUIT,
+    FRUIT_SPEED,
     GHOST,
     GHOST_MOVE_CICLE,
+    GHOST_SPEED,
     LEFT,
     MAX_FRUIT_CYCLES,
     MOVE,
@@ -25,15 +27,21 @@ from errors import AtmanDied
 
 
 class Atman:
-    def __init__(self, board: list[list[int]]):
+    def __init__(self, board: list[list[int]], wheel=None):
         self.x = 1
         self.y = 1
         self.score = 0
         self.board = board
+        # Camada de bitsets do tabuleiro, caso esteja habilitada.
+        self.bitboard = getattr(board, 'bitboard', None)
         self.direction = None
         self.fruit_active = False
         self.fruit_cycles = 0
         self.ghost_ated = None
+        # Agendador de ticks usado para a duração da fruta. Caso não
+        # seja fornecido, a fruta é avançada pelos movimentos dos Ghosts.
+        self.wheel = wheel
+        self._fruit_timer = None
 
     def move(self):
         """Move o Atman na direção indicada em `self.direction`."""
@@ -57,7 +65,7 @@ class Atman:
             self.score += POINT_VALUE
 
         if self.ate(FRUIT, x, y):
-            self.fruit_active = True
+            self.activate_fruit()
 
         if self.ate(GHOST, x, y):
             if self.fruit_active:
@@ -72,8 +80,37 @@ class Atman:
 
         self.board[self.y][self.x] = EMPTY
         self.board[y][x] = ATMAN
+
+        if self.bitboard is not None:
+            self.bitboard.set_cell(self.y, self.x, EMPTY)
+            self.bitboard.set_cell(y, x, ATMAN)
+
         self.x, self.y = x, y
 
+    def activate_fruit(self):
+        """Ativa (ou reinicia) o efeito da fruta."""
+
+        self.fruit_active = True
+        self.fruit_cycles = 0
+
+        if self.wheel is not None:
+            if self._fruit_timer is not None:
+                self._fruit_timer.cancel()
+            self._fruit_timer = self.wheel.schedule_repeating(FRUIT_SPEED, self.advance_fruit)
+
+    def advance_fruit(self):
+        """Avança um ciclo da fruta e a desativa ao atingir `MAX_FRUIT_CYCLES`."""
+
+        self.fruit_cycles += 1
+
+        if self.fruit_cycles >= MAX_FRUIT_CYCLES:
+            self.fruit_active = False
+            self.fruit_cycles = 0
+
+            if self._fruit_timer is not None:
+                self._fruit_timer.cancel()
+                self._fruit_timer = None
+
     def change_direction(self, direction):
         """Muda a direção do Atman para a direção fornecida."""
 
@@ -107,9 +144,11 @@ class Atman:
 
 
 class Ghost:
-    def __init__(self, board: list[list[int]], atman: Atman, x: int, y: int):
+    def __init__(self, board: list[list[int]], atman: Atman, x: int, y: int, pathfinder=None):
         self.atman = atman
         self.board = board
+        # Camada de bitsets do tabuleiro, caso esteja habilitada.
+        self.bitboard = getattr(board, 'bitboard', None)
         self.x = x
         self.y = y
         self._prev_x = -1
@@ -119,45 +158,64 @@ class Ghost:
         self.path = deque()
         self.direction = None
         self.last_cell_value = EMPTY
+        # Movimentos por tick quando o Ghost é agendado em um `TimingWheel`.
+        self.speed = GHOST_SPEED
+        self.alive = True
+        self._fleeing = False
+        # Serviço de busca em segundo plano. Caso não seja
+        # fornecido, os caminhos são calculados no próprio tick.
+        self.pathfinder = pathfinder
 
         # Desenha o Ghost em sua posição inicial.
         self.board[self.y][self.x] = GHOST
+        if self.bitboard is not None:
+            self.bitboard.set_cell(self.y, self.x, GHOST)
 
     def move(self):
-        """Move o Ghost."""
+        """Move o Ghost a cada dois ciclos do `GHOST_MOVE_CICLE` global.
+        Usado quando o Ghost não é agendado em um `TimingWheel`."""
 
         if next(GHOST_MOVE_CICLE) == MOVE:
-            if self.atman.fruit_active:
-                # Caso a fruta tenha sido ativada começa a mover o
-                # Ghost para longe do Atman.
+            # Sem um agendador, a duração da fruta é
+            # medida pelos movimentos dos Ghosts.
+            if self.atman.fruit_active and self.atman.wheel is None:
+                self.atman.advance_fruit()
+
+            self.step()
 
-                # Remove a direção anterior do Ghost caso a fruta
-                # tenha acabado de ser ativada.
-                if self.atman.fruit_cycles == 0:
-                    self.direction = None
+    def step(self):
+        """Executa um movimento do Ghost."""
 
-                # Desativa a fruta caso tenha atingido o limite de ciclos
-                # (que vale como medida de tempo de vida da fruta).
-                elif self.atman.fruit_cycles == MAX_FRUIT_CYCLES:
-                    self.atman.fruit_active = False
-                    self.atman.fruit_cycles = 0
+        if self.atman.fruit_active:
+            # Caso a fruta tenha sido ativada começa a mover o
+            # Ghost para longe do Atman.
 
-                self.atman.fruit_cycles += 1
-                self.move_away_from_atman()
+            # Remove a direção anterior do Ghost caso a fruta
+            # tenha acabado de ser ativada.
+            if not self._fleeing:
+                self.direction = None
+                self._fleeing = True
 
-            elif self.in_atman_range():
+            self.move_away_from_atman()
+            return
+
+        self._fleeing = False
+
+        if self.in_atman_range():
+            if self.path:
+                # Caso tenha um caminho, move o Ghost.
+                self._follow_atman()
+            else:
+                # Caso não tenha um caminho, obtem um
+                # novo caminho e move o Ghost. Com o serviço de
+                # busca o caminho só chega no próximo tick.
+                self.get_new_path_to_atman()
                 if self.path:
-                    # Caso tenha um caminho, move o Ghost.
-                    self._follow_atman()
-                else:
-                    # Caso não tenha um caminho, obtem um
-                    # novo caminho e move o Ghost.
-                    self.get_new_path_to_atman()
                     self._follow_atman()
 
-            else:
-                # Caso não esteja no range, move o Ghost aleatóriamente.
-                self.move_randomly()
+        else:
+            # Caso não esteja no range, move o Ghost aleatóriamente.
+            self.move_randomly()
 
     def in_atman_range(self, range_size=ATMAN_RANGE_SIZE):
         """Verifica se o Ghost está no range para seguir o atman."""
@@ -276,6 +334,11 @@ class Ghost:
         # Move o Ghost para as coordenadas (x, y).
         # e atualiza as coordenadas do Ghost
         self.board[y][x] = GHOST
+
+        if self.bitboard is not None:
+            self.bitboard.set_cell(self.y, self.x, self.board[self.y][self.x])
+            self.bitboard.set_cell(y, x, GHOST)
+
         self._prev_x, self._prev_y = self.x, self.y
         self.x, self.y = x, y
 
@@ -303,18 +366,64 @@ class Ghost:
     def get_new_path_to_atman(self):
         """Atualiza o caminho mais curto para o Atman."""
 
-        self.path = self._get_path_to_atman()
+        if self.pathfinder is not None:
+            self.pathfinder.request(self)
+        else:
+            self.path = self.compute_path_to_atman()
+
+    def compute_path_to_atman(self):
+        """Retorna um novo menor caminho para o Atman."""
+
+        return BFS.search(self.board, (self.y, self.x), (self.atman.y, self.atman.x))
+
+    def receive_path(self, path, start_position):
+        """Recebe um caminho calculado em segundo plano a partir de `start_position`."""
+
+        # O Ghost pode ter andado enquanto o caminho era calculado. Procura,
+        # a partir do alvo, a primeira celula do caminho (incluindo a posição
+        # inicial) em que o Ghost está ou que é vizinha dele, e mantém apenas
+        # o trecho dali até o alvo. Caso não exista, o caminho é descartado.
+        path.append(start_position)
+
+        for index, (y, x) in enumerate(path):
+            distance = abs(y - self.y) + abs(x - self.x)
+            if distance <= 1:
+                keep = index + 1 if distance else index
+                while len(path) > keep:
+                    path.pop()
+                self.path = path
+                return
 
     def is_the_atman(self, x, y):
         """Verifica se o Ghost atingiu o Atman."""
 
         return self.board[y][x] == ATMAN
 
+    def kill(self):
+        """Remove o Ghost do tabuleiro após ser comido pelo Atman.
+        A celula dele passa a ser do Atman, então não é restaurada."""
+
+        self.alive = False
+        self.path.clear()
+
     def reset(self):
+        """Recoloca o Ghost na sua posição inicial, que deve estar livre."""
+
         self.x = self._original_x
         self.y = self._original_y
+        self._prev_x = -1
+        self._prev_y = -1
+        self.path.clear()
+        self.direction = None
+        self.alive = True
         self.atman.ghost_ated = None
 
+        # Desenha o Ghost novamente, guardando o valor da celula.
+        self.last_cell_value = self.board[self.y][self.x]
+        self.board[self.y][self.x] = GHOST
+        if self.bitboard is not None:
+            self.bitboard.set_cell(self.y, self.x, GHOST)
+
     def _get_available_directions(self):
         """Retorna uma lista com as direções disponíveis para o Ghost."""
 
@@ -376,17 +485,20 @@ class Ghost:
 
         return available_directions
 
-    def _get_path_to_atman(self):
-        """Retorna um novo menor caminho para o Atman."""
-
-        return BFS.search(self.board, (self.y, self.x), (self.atman.y, self.atman.x))
-
     def _follow_atman(self):
         """Move o Ghost para a proxima posição em direção ao Atman."""
 
         # Pega a proxima posição sem remove-la.
         y, x = self.path[-1]
 
+        # Com o serviço de busca, um caminho que não parte mais da posição
+        # do Ghost (por exemplo, após ele se mover aleatoriamente) é
+        # descartado e o Ghost aguarda o novo caminho.
+        if self.pathfinder is not None and abs(y - self.y) + abs(x - self.x) != 1:
+            self.path.clear()
+            self.get_new_path_to_atman()
+            return
+
         # Verifica se o Ghost atingiu o Atman.
         if self.is_the_atman(x, y):
             raise AtmanDied
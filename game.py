@@ -1,4 +1,5 @@
 import curses
+from functools import partial
 from random import choice
 from time import sleep
 
@@ -6,33 +7,66 @@ from board import Board
 from config import (
     ATMAN,
     CHARS,
+    DOWN,
     EMPTY,
     FRUIT,
     GHOST,
+    GHOST_RESPAWN_TICKS,
     GHOST_VALUE,
-    KEY_MAP,
+    LEFT,
     MAX_FRUIT_CYCLES,
     POINT,
+    RIGHT,
     SLEEP_TIME,
+    UP,
     WALL,
 )
 from entities import Atman, Ghost
+from pathfinding import PathfindingService, PathProvider
+from timing_wheel import TimingWheel
+
+# Define as teclas mapeadas para direções.
+# Fica aqui, e não em `config`, para que a lógica do jogo
+# possa ser importada sem o `curses` (ex.: em workers).
+KEY_MAP = {
+    curses.KEY_UP: UP,
+    curses.KEY_DOWN: DOWN,
+    curses.KEY_LEFT: LEFT,
+    curses.KEY_RIGHT: RIGHT,
+    ord('w'): UP,
+    ord('W'): UP,
+    ord('s'): DOWN,
+    ord('S'): DOWN,
+    ord('a'): LEFT,
+    ord('A'): LEFT,
+    ord('d'): RIGHT,
+    ord('D'): RIGHT,
+}
 
 
 class Game:
-    def __init__(self, win: curses.window, board: Board, atman: Atman):
+    def __init__(self, win: curses.window, board: Board, atman: Atman, pathfinder: PathProvider = None):
         self.win = win
         self.board = board
         self.atman = atman
+        self.pathfinder = pathfinder
         self.setup_window()
 
+        # Agendador dos movimentos dos Ghosts e dos temporizadores
+        # do jogo. A cada tick só as entidades previstas são movidas.
+        self.wheel = TimingWheel()
+        self.atman.wheel = self.wheel
+
         mid_x = (self.board.get_columns() // 2, self.board.get_rows() // 2)
 
         self.ghosts = (
-            Ghost(self.board, self.atman, mid_x[0] - 1, 11),
-            Ghost(self.board, self.atman, mid_x[0] + 1, 11),
-            Ghost(self.board, self.atman, mid_x[0], 11),
+            Ghost(self.board, self.atman, mid_x[0] - 1, 11, self.pathfinder),
+            Ghost(self.board, self.atman, mid_x[0] + 1, 11, self.pathfinder),
+            Ghost(self.board, self.atman, mid_x[0], 11, self.pathfinder),
         )
+        self._ghost_timers = {}
+        for ghost in self.ghosts:
+            self.schedule_ghost(ghost)
 
         self.xsize = self.board.get_columns()  # Numero de colunas do tabuleiro.
         self.ysize = self.board.get_rows()  # Numero de linhas do tabuleiro.
@@ -96,16 +130,47 @@ class Game:
     def update_entities_positions(self):
         """Atualiza as posicoes dos Ghosts e o Atman."""
 
+        # Entrega os caminhos calculados desde o tick anterior.
+        if self.pathfinder is not None:
+            self.pathfinder.deliver()
+
         self.atman.move()
 
         if self.atman.ghost_ated:
             for ghost in self.ghosts:
-                if (ghost.y, ghost.x) == self.atman.ghost_ated:
+                if ghost.alive and (ghost.y, ghost.x) == self.atman.ghost_ated:
                     self.atman.score += GHOST_VALUE
-                    ghost.reset()
-        else:
-            for ghost in self.ghosts:
-                ghost.move()
+                    self.kill_ghost(ghost)
+            self.atman.ghost_ated = None
+
+        # Move os Ghosts e avança os temporizadores previstos para este tick.
+        self.wheel.advance()
+
+    def schedule_ghost(self, ghost: Ghost):
+        """Agenda os movimentos do Ghost de acordo com a sua velocidade.
+        Cada Ghost recebe uma fase diferente, para que não se movam todos
+        no mesmo tick."""
+
+        offset = self.ghosts.index(ghost) / len(self.ghosts)
+        self._ghost_timers[ghost] = self.wheel.schedule_repeating(ghost.speed, ghost.step, offset)
+
+    def kill_ghost(self, ghost: Ghost):
+        """Remove o Ghost comido e agenda o seu retorno."""
+
+        self._ghost_timers.pop(ghost).cancel()
+        ghost.kill()
+        self.wheel.schedule(GHOST_RESPAWN_TICKS, partial(self.respawn_ghost, ghost))
+
+    def respawn_ghost(self, ghost: Ghost):
+        """Recoloca o Ghost na posição inicial e volta a movê-lo.
+        Caso a posição inicial esteja ocupada, tenta novamente no próximo tick."""
+
+        if self.board[ghost._original_y][ghost._original_x] in {GHOST, ATMAN}:
+            self.wheel.schedule(1, partial(self.respawn_ghost, ghost))
+            return
+
+        ghost.reset()
+        self.schedule_ghost(ghost)
 
     def render_footer(self):
         """Renderiza o rodapé da tela."""
@@ -184,8 +249,9 @@ if __name__ == '__main__':
     def main(win: curses.window):
         board = Board(1)
         atman = Atman(board)
-        game = Game(win, board, atman)
 
-        game.start()
+        with PathfindingService(board, use_processes=True) as pathfinder:
+            game = Game(win, board, atman, pathfinder)
+            game.start()
 
     curses.wrapper(main)
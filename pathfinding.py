@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol
+
+from bfs import BFSContext
+
+# Contexto de busca de cada worker, criado na inicialização
+# da thread (ou do processo) a partir do tabuleiro estático.
+_worker_local = threading.local()
+
+
+def _init_worker(board: list[list[int]]):
+    """Inicializa o worker com um contexto de busca do tabuleiro."""
+
+    _worker_local.context = BFSContext(board)
+
+
+def _search(start_position: tuple[int, int], target_position: tuple[int, int]):
+    """Executa a busca no worker reutilizando o contexto da thread atual."""
+
+    return _worker_local.context.search(start_position, target_position)
+
+
+class PathProvider(Protocol):
+    """Interface dos serviços que calculam os caminhos dos Ghosts fora
+    do seu movimento, como o `PathfindingService` e o `ReplanScheduler`."""
+
+    def request(self, ghost): ...
+
+    def deliver(self): ...
+
+
+class PathfindingService:
+    """Calcula os caminhos dos Ghosts em um pool de workers.
+
+    Os pedidos são feitos pelos Ghosts com `request` e os resultados são
+    entregues por `deliver`, que deve ser chamado no inicio de cada tick.
+    Enquanto o novo caminho não fica pronto o Ghost continua seguindo o
+    caminho anterior, de modo que uma busca lenta não trava o tick.
+
+    A busca é Python puro e limitada pela CPU, então com threads os workers
+    disputam o GIL com o loop do jogo e o tempo do tick ainda cresce com a
+    carga de buscas. Só com `use_processes=True` esse tempo fica limitado."""
+
+    def __init__(self, board: list[list[int]], workers=2, use_processes=False):
+        # Os workers só precisam das paredes, que não mudam durante o jogo,
+        # então recebem uma cópia do tabuleiro apenas uma vez.
+        static_board = [list(row) for row in board]
+        executor_class = ThreadPoolExecutor
+
+        if use_processes:
+            # Importado apenas quando necessário, já que o `multiprocessing`
+            # pesa bastante no tempo de importação.
+            from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+            executor_class = ProcessPoolExecutor
+
+        self._executor = executor_class(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(static_board,),
+        )
+        self._pending = {}
+
+    def request(self, ghost):
+        """Agenda um novo caminho do Ghost até o Atman.
+        Caso o Ghost já tenha um pedido pendente, o pedido é ignorado."""
+
+        if ghost in self._pending:
+            return
+
+        start_position = (ghost.y, ghost.x)
+        target_position = (ghost.atman.y, ghost.atman.x)
+        future = self._executor.submit(_search, start_position, target_position)
+        self._pending[ghost] = (future, start_position)
+
+    def deliver(self):
+        """Entrega aos Ghosts os caminhos que já foram calculados."""
+
+        for ghost, (future, start_position) in list(self._pending.items()):
+            if future.done():
+                del self._pending[ghost]
+                ghost.receive_path(future.result(), start_position)
+
+    def pending_count(self):
+        return len(self._pending)
+
+    def shutdown(self):
+        """Encerra os workers e descarta os pedidos pendentes."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
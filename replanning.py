@@ -0,0 +1,81 @@
+from collections import Counter
+from time import thread_time
+
+from config import AI_TICK_BUDGET, MAX_REPLAN_STALENESS
+
+
+class ReplanScheduler:
+    """Distribui os novos caminhos dos Ghosts entre os ticks.
+
+    Segue a mesma interface do `PathfindingService`: os Ghosts pedem um
+    novo caminho com `request` e `deliver`, chamado no inicio de cada tick,
+    calcula os pedidos em ordem de proximidade com o Atman até esgotar o
+    orçamento de tempo de CPU do tick. O tempo é medido com `thread_time`,
+    então o tempo em que a thread fica parada não é contado. Os pedidos
+    restantes ficam para os próximos ticks, a não ser que já tenham
+    esperado `max_staleness` ticks. Enquanto isso, os Ghosts continuam
+    seguindo o caminho anterior."""
+
+    def __init__(self, budget=AI_TICK_BUDGET, max_staleness=MAX_REPLAN_STALENESS):
+        self.budget = budget  # (segundos de CPU)
+        self.max_staleness = max_staleness  # (ticks)
+        self._pending = {}
+
+        # Contadores acumulados: pedidos, caminhos calculados, pedidos
+        # adiados, caminhos forçados pela espera máxima e ticks que
+        # ultrapassaram o orçamento.
+        self.counters = Counter()
+        self.last_tick_time = 0.0
+        self.max_tick_time = 0.0
+
+    def request(self, ghost):
+        """Agenda um novo caminho do Ghost até o Atman.
+        Caso o Ghost já tenha um pedido pendente, o pedido é ignorado."""
+
+        if ghost in self._pending:
+            return
+
+        self._pending[ghost] = 0
+        self.counters['requested'] += 1
+
+    def deliver(self):
+        """Calcula os caminhos pendentes dentro do orçamento do tick."""
+
+        if not self._pending:
+            self.last_tick_time = 0.0
+            return
+
+        # Os Ghosts mais próximos do Atman têm prioridade.
+        ghosts = sorted(self._pending, key=self._distance_to_atman)
+
+        start_time = thread_time()
+        elapsed = 0.0
+
+        for ghost in ghosts:
+            staleness = self._pending[ghost]
+
+            if elapsed >= self.budget and staleness < self.max_staleness:
+                self._pending[ghost] = staleness + 1
+                self.counters['deferred'] += 1
+                continue
+
+            if elapsed >= self.budget:
+                self.counters['forced'] += 1
+
+            del self._pending[ghost]
+            ghost.receive_path(ghost.compute_path_to_atman(), (ghost.y, ghost.x))
+            self.counters['replanned'] += 1
+            elapsed = thread_time() - start_time
+
+        if elapsed > self.budget:
+            self.counters['over_budget'] += 1
+
+        self.last_tick_time = elapsed
+        self.max_tick_time = max(self.max_tick_time, elapsed)
+
+    def pending_count(self):
+        return len(self._pending)
+
+    @staticmethod
+    def _distance_to_atman(ghost):
+        return abs(ghost.y - ghost.atman.y) + abs(ghost.x - ghost.atman.x)
@@ -0,0 +1,131 @@
+from fractions import Fraction
+from math import ceil
+
+
+class Timer:
+    """Evento agendado em um `TimingWheel`."""
+
+    __slots__ = ('due', 'callback', 'interval', 'position', 'cancelled')
+
+    def __init__(self, due: int, callback, interval: Fraction = None):
+        self.due = due
+        self.callback = callback
+        # Intervalo fracionário entre as execuções de um evento repetido
+        # e a posição exata (não arredondada) da próxima execução.
+        self.interval = interval
+        self.position = Fraction(due)
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancela o evento. Ele é descartado quando o seu slot for visitado."""
+
+        self.cancelled = True
+
+
+class TimingWheel:
+    """Agendador de eventos por tick (hashed timing wheel).
+
+    Cada evento fica no slot `due % slots`, então avançar um tick só visita
+    os eventos daquele slot, em vez de todas as entidades do jogo. Eventos
+    agendados para mais de uma volta da roda permanecem no slot até que o
+    tick em que devem ser executados seja alcançado."""
+
+    def __init__(self, slots=64):
+        self.tick = 0
+        self._slots = [[] for _ in range(slots)]
+
+    def schedule(self, delay: int, callback):
+        """Agenda `callback` para ser executado daqui a `delay` ticks."""
+
+        timer = Timer(self.tick + max(1, delay), callback)
+        self._insert(timer)
+        return timer
+
+    def schedule_repeating(self, speed: float, callback, offset: float = 0):
+        """Agenda `callback` para ser executado `speed` vezes por tick, em média.
+        Por exemplo, 0.5 executa a cada dois ticks e 0.4 a cada dois ticks e meio.
+
+        `offset` adianta a primeira execução em uma fração do intervalo,
+        o que permite espalhar eventos com a mesma velocidade entre os ticks."""
+
+        if speed <= 0:
+            raise ValueError(f'A velocidade deve ser maior que zero, recebido: {speed}')
+        if not 0 <= offset < 1:
+            raise ValueError(f'O offset deve estar entre 0 (inclusivo) e 1, recebido: {offset}')
+
+        interval = 1 / Fraction(speed).limit_denominator(1000)
+        timer = Timer(0, callback, interval)
+        timer.position = self.tick + interval * (1 - Fraction(offset).limit_denominator(1000))
+        timer.due = max(self.tick + 1, ceil(timer.position))
+        self._insert(timer)
+        return timer
+
+    def advance(self):
+        """Avança um tick e executa os eventos previstos para ele."""
+
+        self.tick += 1
+        index = self.tick % len(self._slots)
+        slot = self._slots[index]
+
+        if not slot:
+            return
+
+        # Separa os eventos deste tick dos que estão em voltas futuras.
+        due_timers = []
+        remaining = []
+        for timer in slot:
+            if timer.cancelled:
+                continue
+            if timer.due <= self.tick:
+                due_timers.append(timer)
+            else:
+                remaining.append(timer)
+        self._slots[index] = remaining
+
+        # Os eventos são agendados novamente mesmo que um deles lance uma
+        # exceção (ex.: `AtmanDied`). Os que não chegaram a ser executados
+        # ficam para o próximo tick, antes dos que já foram executados.
+        fired = []
+        next_index = 0
+        try:
+            for timer in due_timers:
+                next_index += 1
+                if timer.cancelled:
+                    continue
+                if timer.interval is not None:
+                    fired.append(timer)
+                self._fire(timer)
+        finally:
+            self._reschedule(due_timers[next_index:], fired)
+
+    def _fire(self, timer: Timer):
+        """Executa o evento. Eventos repetidos com velocidade maior que 1
+        podem ser executados mais de uma vez no mesmo tick."""
+
+        if timer.interval is None:
+            timer.callback()
+            return
+
+        while True:
+            timer.position += timer.interval
+            timer.callback()
+            if timer.cancelled or ceil(timer.position) > self.tick:
+                break
+
+    def _reschedule(self, skipped: list[Timer], fired: list[Timer]):
+        """Agenda novamente os eventos não executados e os eventos repetidos."""
+
+        for timer in skipped:
+            if not timer.cancelled:
+                # O evento é adiado um tick, sem tentar recuperar a execução perdida.
+                timer.due = self.tick + 1
+                timer.position = Fraction(timer.due)
+                self._insert(timer)
+
+        for timer in fired:
+            if not timer.cancelled:
+                timer.due = max(self.tick + 1, ceil(timer.position))
+                self._insert(timer)
+
+    def _insert(self, timer: Timer):
+        self._slots[timer.due % len(self._slots)].append(timer)